@@ -2,14 +2,20 @@
 
 import json
 import os
+import re
 import secrets
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+import orjson
 from flask import Flask, render_template, request, jsonify, redirect, url_for, session
+from flask.json.provider import DefaultJSONProvider
 from dotenv import load_dotenv
 
-from scraper import ArticleScraper
+from cache import TTLCache, make_key
+from config import DIGEST_CACHE_TTL, DIGEST_CACHE_SIZE
+from scraper import ArticleScraper, normalize_url
 from summarizer import DigestGenerator
 from models import db, User, Generation
 from auth import (
@@ -21,7 +27,19 @@ from payments import get_pricing_tiers, create_checkout_session, handle_successf
 
 load_dotenv()
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for faster API responses."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Configuration
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', secrets.token_hex(32))
@@ -34,31 +52,19 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 # Initialize database
 db.init_app(app)
 
-with app.app_context():
-    db.create_all()
+# Create tables at startup unless disabled (set RUN_DB_INIT=0 on workers
+# when the schema is created once at deploy time instead)
+if os.environ.get('RUN_DB_INIT', '1') == '1':
+    with app.app_context():
+        db.create_all()
 
+# Recently generated results, so resubmitting the same request doesn't
+# re-scrape the site and pay for another Claude call
+digest_cache = TTLCache(maxsize=DIGEST_CACHE_SIZE, ttl=DIGEST_CACHE_TTL)
 
-def send_magic_link_email(email: str, magic_link: str) -> bool:
-    """Send magic link email using SMTP."""
-    smtp_host = os.environ.get('SMTP_HOST', 'smtp.gmail.com')
-    smtp_port = int(os.environ.get('SMTP_PORT', 587))
-    smtp_user = os.environ.get('SMTP_USER', '')
-    smtp_pass = os.environ.get('SMTP_PASS', '')
-    from_email = os.environ.get('FROM_EMAIL', smtp_user)
-
-    if not smtp_user or not smtp_pass:
-        print(f"SMTP not configured. Magic link: {magic_link}")
-        return True  # Return True for development
 
-    print(f"Attempting to send email via {smtp_host}:{smtp_port} as {smtp_user}")
-
-    try:
-        msg = MIMEMultipart('alternative')
-        msg['Subject'] = 'Sign in to Well Done Digest'
-        msg['From'] = from_email
-        msg['To'] = email
-
-        text = f"""Sign in to Well Done Digest
+# Magic link email bodies; {magic_link} is filled in per send
+MAGIC_LINK_TEXT_TEMPLATE = """Sign in to Well Done Digest
 
 Click the link below to sign in:
 {magic_link}
@@ -68,7 +74,7 @@ This link expires in 1 hour.
 If you didn't request this, you can safely ignore this email.
 """
 
-        html = f"""
+MAGIC_LINK_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head></head>
@@ -84,13 +90,72 @@ If you didn't request this, you can safely ignore this email.
 </html>
 """
 
+# Long-lived SMTP connection reused across sends, so each magic link doesn't
+# pay for a fresh TLS handshake and login. Guarded by a lock because the
+# app runs with threaded workers.
+_smtp_lock = threading.Lock()
+_smtp_connection = None
+
+
+def _smtp_send(host: str, port: int, user: str, password: str, from_email: str, to_email: str, message: str):
+    """Send a message over the shared SMTP connection, reconnecting if it dropped."""
+    global _smtp_connection
+
+    with _smtp_lock:
+        for attempt in range(2):
+            if _smtp_connection is None:
+                server = smtplib.SMTP(host, port, timeout=30)
+                try:
+                    server.starttls()
+                    server.login(user, password)
+                except BaseException:
+                    # Don't leak the socket when the handshake or login fails
+                    server.close()
+                    raise
+                _smtp_connection = server
+            try:
+                _smtp_connection.sendmail(from_email, to_email, message)
+                return
+            except smtplib.SMTPServerDisconnected:
+                # Server closed the idle connection; reconnect once and retry
+                _smtp_connection = None
+                if attempt:
+                    raise
+            except Exception:
+                try:
+                    _smtp_connection.close()
+                finally:
+                    _smtp_connection = None
+                raise
+
+
+def send_magic_link_email(email: str, magic_link: str) -> bool:
+    """Send magic link email using SMTP."""
+    smtp_host = os.environ.get('SMTP_HOST', 'smtp.gmail.com')
+    smtp_port = int(os.environ.get('SMTP_PORT', 587))
+    smtp_user = os.environ.get('SMTP_USER', '')
+    smtp_pass = os.environ.get('SMTP_PASS', '')
+    from_email = os.environ.get('FROM_EMAIL', smtp_user)
+
+    if not smtp_user or not smtp_pass:
+        print(f"SMTP not configured. Magic link: {magic_link}")
+        return True  # Return True for development
+
+    print(f"Attempting to send email via {smtp_host}:{smtp_port} as {smtp_user}")
+
+    try:
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = 'Sign in to Well Done Digest'
+        msg['From'] = from_email
+        msg['To'] = email
+
+        text = MAGIC_LINK_TEXT_TEMPLATE.format(magic_link=magic_link)
+        html = MAGIC_LINK_HTML_TEMPLATE.format(magic_link=magic_link)
+
         msg.attach(MIMEText(text, 'plain'))
         msg.attach(MIMEText(html, 'html'))
 
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            server.starttls()
-            server.login(smtp_user, smtp_pass)
-            server.sendmail(from_email, email, msg.as_string())
+        _smtp_send(smtp_host, smtp_port, smtp_user, smtp_pass, from_email, email, msg.as_string())
 
         return True
 
@@ -99,6 +164,23 @@ If you didn't request this, you can safely ignore this email.
         return False
 
 
+# One non-blank line of the specific-URLs textarea, without surrounding whitespace
+_URL_LINE_RE = re.compile(r"^[ \t]*(\S.*?)\s*$", re.MULTILINE)
+
+
+def _parse_specific_urls(text: str) -> list[str]:
+    """Split the specific-URLs textarea into normalized URLs in a single pass."""
+    return [normalize_url(m.group(1)) for m in _URL_LINE_RE.finditer(text)]
+
+
+def _parse_count(value, default: int) -> int:
+    """Parse an article count, clamped to 1-20, falling back to default."""
+    try:
+        return max(1, min(int(value), 20))
+    except (ValueError, TypeError):
+        return default
+
+
 @app.route("/")
 def index():
     """Render the main page with the form."""
@@ -212,38 +294,29 @@ def generate():
     url = request.form.get("url", "").strip()
     mode = request.form.get("mode", "recent")
     output_type = request.form.get("output_type", "both")  # digest, social, or both
-    count = request.form.get("count", "10")
+    count = _parse_count(request.form.get("count", "10"), 10)
     specific_urls = request.form.get("specific_urls", "").strip()
     pasted_articles_json = request.form.get("pasted_articles", "").strip()
 
     # Handle separate counts for "both" mode
-    digest_count = request.form.get("digest_count", count)
-    social_count = request.form.get("social_count", count)
-
-    try:
-        count = int(count)
-        count = max(1, min(count, 20))
-    except ValueError:
-        count = 10
-
-    try:
-        digest_count = int(digest_count)
-        digest_count = max(1, min(digest_count, 20))
-    except (ValueError, TypeError):
-        digest_count = count
-
-    try:
-        social_count = int(social_count)
-        social_count = max(1, min(social_count, 20))
-    except (ValueError, TypeError):
-        social_count = count
+    digest_count = _parse_count(request.form.get("digest_count"), count)
+    social_count = _parse_count(request.form.get("social_count"), count)
 
     # For non-paste, non-specific modes, URL is required
     if mode not in ("specific", "paste") and not url:
         return render_template("index.html", error="Please enter a URL")
 
-    if url and not url.startswith(("http://", "https://")):
-        url = "https://" + url
+    url = normalize_url(url)
+
+    cache_key = make_key(
+        "generate", mode, url, output_type, count, digest_count, social_count,
+        specific_urls if mode == "specific" else "",
+        pasted_articles_json if mode == "paste" else "",
+        request.form.get("paste_site_name", "").strip() if mode == "paste" else "",
+    )
+    cached = digest_cache.get(cache_key)
+    if cached is not None:
+        return render_template("result.html", **cached)
 
     try:
         # Paste mode: build articles from pasted text
@@ -276,8 +349,7 @@ def generate():
             scraper = ArticleScraper(url) if url else None
 
             if mode == "specific" and specific_urls:
-                urls_list = [u.strip() for u in specific_urls.split('\n') if u.strip()]
-                urls_list = [u if u.startswith(('http://', 'https://')) else 'https://' + u for u in urls_list]
+                urls_list = _parse_specific_urls(specific_urls)
 
                 if not urls_list:
                     return render_template("index.html", error="Please provide at least one article URL")
@@ -311,14 +383,15 @@ def generate():
         elif mode == "paste":
             display_url = site_name
 
-        return render_template(
-            "result.html",
-            digest=digest,
-            formatted=formatted,
-            url=display_url,
-            count=len(articles),
-            output_type=output_type
-        )
+        context = {
+            "digest": digest,
+            "formatted": formatted,
+            "url": display_url,
+            "count": len(articles),
+            "output_type": output_type,
+        }
+        digest_cache.set(cache_key, context)
+        return render_template("result.html", **context)
 
     except ValueError as e:
         return render_template("index.html", error=str(e))
@@ -333,19 +406,17 @@ def api_generate():
     """API endpoint for generating digests."""
     data = request.get_json() or {}
     url = data.get("url", "").strip()
-    count = data.get("count", 10)
-
-    try:
-        count = int(count)
-        count = max(1, min(count, 20))
-    except (ValueError, TypeError):
-        count = 10
+    count = _parse_count(data.get("count", 10), 10)
 
     if not url:
         return jsonify({"error": "URL is required"}), 400
 
-    if not url.startswith(("http://", "https://")):
-        url = "https://" + url
+    url = normalize_url(url)
+
+    cache_key = make_key("api", url, count)
+    cached = digest_cache.get(cache_key)
+    if cached is not None:
+        return jsonify(cached)
 
     try:
         scraper = ArticleScraper(url)
@@ -357,12 +428,14 @@ def api_generate():
         generator = DigestGenerator()
         digest = generator.generate_digest(articles, site_name=site_name)
 
-        return jsonify({
+        payload = {
             "success": True,
             "url": url,
             "article_count": len(articles),
             "digest": digest
-        })
+        }
+        digest_cache.set(cache_key, payload)
+        return jsonify(payload)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
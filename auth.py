@@ -1,27 +1,43 @@
 """Authentication module with magic link email login."""
 
 import os
+import re
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
 from urllib.parse import urljoin
 
-from flask import session, redirect, url_for, request, current_app
+from flask import session, redirect, url_for, request, current_app, g
 from itsdangerous import URLSafeTimedSerializer, SignatureExpired, BadSignature
+from sqlalchemy import update
 
 from models import db, User
 
 # Token expiry time (1 hour)
 TOKEN_EXPIRY_SECONDS = 3600
 
+# Shape of a URLSafeTimedSerializer token: [.]payload.timestamp.signature
+_TOKEN_RE = re.compile(r"\.?[\w-]+\.[\w-]+\.[\w-]+")
+_MAX_TOKEN_LENGTH = 512
+
 # Admin email (gets unlimited free access)
 ADMIN_EMAIL = os.environ.get('ADMIN_EMAIL', '')
 
+# Marks "not looked up yet" in the per-request user cache (None means logged out)
+_UNSET = object()
+
+# Runs bookkeeping writes the response doesn't need to wait for
+_background = ThreadPoolExecutor(max_workers=1)
+
 
 def get_serializer():
-    """Get the URL-safe serializer for magic links."""
-    secret_key = current_app.config['SECRET_KEY']
-    return URLSafeTimedSerializer(secret_key)
+    """Get the URL-safe serializer for magic links (built once per app)."""
+    serializer = current_app.extensions.get('magic_link_serializer')
+    if serializer is None:
+        serializer = URLSafeTimedSerializer(current_app.config['SECRET_KEY'])
+        current_app.extensions['magic_link_serializer'] = serializer
+    return serializer
 
 
 def generate_magic_link(email: str, base_url: str) -> str:
@@ -33,6 +49,10 @@ def generate_magic_link(email: str, base_url: str) -> str:
 
 def verify_magic_link(token: str) -> str | None:
     """Verify a magic link token and return the email if valid."""
+    # Reject junk cheaply, before any signature work or exception handling
+    if len(token) > _MAX_TOKEN_LENGTH or not _TOKEN_RE.fullmatch(token):
+        return None
+
     serializer = get_serializer()
     try:
         email = serializer.loads(token, salt='magic-link', max_age=TOKEN_EXPIRY_SECONDS)
@@ -61,14 +81,25 @@ def get_or_create_user(email: str) -> User:
     return user
 
 
+def _record_login(app, user_id: int, logged_in_at: datetime):
+    """Store a user's last_login timestamp (runs off the request thread)."""
+    try:
+        with app.app_context():
+            db.session.execute(update(User).where(User.id == user_id).values(last_login=logged_in_at))
+            db.session.commit()
+    except Exception as e:
+        print(f"Failed to record login for user {user_id}: {e}")
+
+
 def login_user(user: User):
     """Log in a user by setting session data."""
-    user.last_login = datetime.utcnow()
-    db.session.commit()
+    # last_login isn't read during sign-in, so write it in the background
+    _background.submit(_record_login, current_app._get_current_object(), user.id, datetime.utcnow())
 
     session['user_id'] = user.id
     session['user_email'] = user.email
     session['is_admin'] = user.is_admin
+    g._current_user = user
 
 
 def logout_user():
@@ -76,14 +107,17 @@ def logout_user():
     session.pop('user_id', None)
     session.pop('user_email', None)
     session.pop('is_admin', None)
+    g.pop('_current_user', None)
 
 
 def get_current_user() -> User | None:
-    """Get the currently logged-in user."""
-    user_id = session.get('user_id')
-    if user_id:
-        return User.query.get(user_id)
-    return None
+    """Get the currently logged-in user (looked up at most once per request)."""
+    user = g.get('_current_user', _UNSET)
+    if user is _UNSET:
+        user_id = session.get('user_id')
+        user = db.session.get(User, user_id) if user_id else None
+        g._current_user = user
+    return user
 
 
 def is_logged_in() -> bool:
@@ -91,6 +125,11 @@ def is_logged_in() -> bool:
     return 'user_id' in session
 
 
+def _is_admin_session() -> bool:
+    """Check the admin flag stored in the session at login (no DB lookup)."""
+    return bool(session.get('is_admin'))
+
+
 def can_generate(user: User) -> bool:
     """Check if a user can generate a digest (has credits or is admin)."""
     if user.is_admin:
@@ -103,17 +142,25 @@ def use_credit(user: User) -> bool:
     if user.is_admin:
         return True  # Admins don't use credits
 
-    if user.credits > 0:
-        user.credits -= 1
-        db.session.commit()
-        return True
-
-    return False
+    # Single conditional UPDATE: no read-modify-write race between concurrent
+    # generations, and the in-session user object is kept in sync
+    result = db.session.execute(
+        update(User)
+        .where(User.id == user.id, User.credits > 0)
+        .values(credits=User.credits - 1)
+    )
+    db.session.commit()
+    return result.rowcount == 1
 
 
 def add_credits(user: User, amount: int):
     """Add credits to a user's account."""
-    user.credits += amount
+    # Increment in SQL, like use_credit, so a concurrent spend isn't overwritten
+    db.session.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(credits=User.credits + amount)
+    )
     db.session.commit()
 
 
@@ -137,6 +184,10 @@ def credits_required(f):
             session['next_url'] = request.url
             return redirect(url_for('login_page'))
 
+        # Admins always have access, so skip loading the user row
+        if _is_admin_session():
+            return f(*args, **kwargs)
+
         user = get_current_user()
         if not user:
             return redirect(url_for('login_page'))
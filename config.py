@@ -8,12 +8,30 @@ load_dotenv()
 # API Configuration
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 CLAUDE_MODEL = "claude-sonnet-4-20250514"
+FAST_MODEL = "claude-haiku-4-5"  # short, single-article outputs (social posts)
+MAX_CONCURRENT_API_CALLS = 5  # Claude requests in flight per digest
+BATCH_POLL_INTERVAL = 30  # seconds between Message Batches status checks
+API_MAX_CONNECTIONS = 40  # open connections to the Claude API per process (gunicorn threads x calls per digest)
+API_KEEPALIVE_CONNECTIONS = 20  # idle connections kept warm between requests
+API_KEEPALIVE_EXPIRY = 60  # seconds an idle connection is kept
+API_MAX_RETRIES = 5  # SDK retries for 429/5xx/overloaded, with backoff that honours retry-after
 
 # Scraping Configuration
 DEFAULT_ARTICLE_COUNT = 10
 REQUEST_TIMEOUT = 30
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
+MAX_CONCURRENT_FETCHES = 5  # article pages fetched in parallel per scrape
+REQUESTS_PER_SECOND = 4  # page requests started per host, per second
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failed fetches before a host is skipped
+CIRCUIT_COOLDOWN = 60  # seconds a failing host is skipped before a retry probe
+HTTP_POOL_CONNECTIONS = 20  # hosts kept in the shared connection pool
+HTTP_POOL_MAXSIZE = 20  # keep-alive connections kept per host
+MAX_PAGE_BYTES = 5 * 1024 * 1024  # larger pages are truncated before parsing
+PAGE_CACHE_TTL = 3600  # seconds a fetched page is kept for conditional re-fetches
+PAGE_CACHE_SIZE = 256  # pages kept (only those with an ETag or Last-Modified)
+PAGE_CACHE_MAX_BYTES = 512 * 1024  # larger pages aren't kept; caps the cache at ~128 MB per process
+ROBOTS_CACHE_TTL = 3600  # seconds a site's parsed robots.txt is reused
 
 # User agent for web requests
 USER_AGENT = (
@@ -21,8 +39,27 @@ USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 )
 
+# Web app result cache (identical submissions within the TTL reuse the digest)
+DIGEST_CACHE_TTL = 900  # seconds
+DIGEST_CACHE_SIZE = 512
+
+# Persistent cache of Claude responses (digests and per-article social posts),
+# so the same articles showing up in several runs are only sent to Claude once
+RESPONSE_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH", "response_cache.db")
+RESPONSE_CACHE_TTL = 30 * 24 * 3600  # seconds
+
 # Summary constraints
 MAX_SUMMARY_WORDS = 50
+SUMMARY_WORD_TOLERANCE = 5  # words over the limit accepted before a summary is sent back to be shortened
+SHORTEN_MAX_TOKENS = 150  # output for one shortened summary
+DIGEST_BASE_TOKENS = 400  # output reserved for the headline and combined summary
+DIGEST_TOKENS_PER_ARTICLE = 120  # a 50-word summary and its marker, with headroom
+DIGEST_MAX_TOKENS = 8192  # ceiling on a digest response
+SOCIAL_POST_MAX_TOKENS = 256  # a short headline and one sentence
+PROMPT_CONTENT_CHARS = 3000  # characters of each article's text sent to Claude
+PROMPT_TAIL_CHARS = 1000  # of those, taken from the article's end (where conclusions are)
+DIGEST_CONTENT_TOKENS = 30000  # article text in one digest prompt, shared between its articles
+CHARS_PER_TOKEN = 4  # rough size of a token in English prose, for budgeting without a tokenizer
 
 # Common article selectors for different website structures
 # These can be customized per website
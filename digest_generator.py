@@ -10,7 +10,7 @@ from pathlib import Path
 
 import click
 
-from scraper import ArticleScraper
+from scraper import ArticleScraper, normalize_url
 from summarizer import DigestGenerator
 from config import DEFAULT_ARTICLE_COUNT
 
@@ -47,7 +47,17 @@ def print_success(message: str):
     is_flag=True,
     help="Show detailed progress information"
 )
-def main(url: str, count: int, output: str, verbose: bool):
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Use the Message Batches API (half price; results can take minutes to hours)"
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Regenerate even if these articles were already summarized"
+)
+def main(url: str, count: int, output: str, verbose: bool, batch: bool, refresh: bool):
     """Generate an article digest from a website.
 
     URL: The website URL to scrape articles from.
@@ -59,6 +69,8 @@ def main(url: str, count: int, output: str, verbose: bool):
         python digest_generator.py https://example-blog.com -n 5
 
         python digest_generator.py https://example-blog.com -o digest.md
+
+        python digest_generator.py https://example-blog.com --batch -o digest.md
     """
     click.echo()
     click.echo(click.style("╔════════════════════════════════════════╗", fg="blue"))
@@ -67,8 +79,7 @@ def main(url: str, count: int, output: str, verbose: bool):
     click.echo()
 
     # Validate URL
-    if not url.startswith(("http://", "https://")):
-        url = "https://" + url
+    url = normalize_url(url)
 
     click.echo(f"Source: {url}")
     click.echo(f"Articles to process: {count}")
@@ -80,7 +91,7 @@ def main(url: str, count: int, output: str, verbose: bool):
 
         scraper = ArticleScraper(url)
         progress_fn = print_progress if verbose else None
-        articles = scraper.scrape_articles(count, progress_callback=progress_fn)
+        articles, site_name = scraper.scrape_articles(count, progress_callback=progress_fn)
 
         print_success(f"Successfully scraped {len(articles)} articles")
         click.echo()
@@ -94,7 +105,8 @@ def main(url: str, count: int, output: str, verbose: bool):
         click.echo(click.style("Step 2/3: Generating summaries with Claude...", fg="yellow", bold=True))
 
         generator = DigestGenerator()
-        digest = generator.generate_digest(articles, progress_callback=progress_fn)
+        digest = generator.generate_digest(articles, progress_callback=progress_fn, site_name=site_name,
+                                           output_type="digest", batch=batch, force_refresh=refresh)
 
         print_success("Successfully generated digest")
         click.echo()
@@ -118,7 +130,7 @@ def main(url: str, count: int, output: str, verbose: bool):
         # Save to file if requested
         if output:
             output_path = Path(output)
-            output_path.write_text(formatted_digest, encoding="utf-8")
+            output_path.write_bytes(formatted_digest.encode("utf-8"))
             click.echo()
             print_success(f"Digest saved to: {output_path}")
 
@@ -19,7 +19,10 @@ class User(db.Model):
 
     # Relationship to purchases
     purchases = db.relationship('Purchase', backref='user', lazy=True)
-    generations = db.relationship('Generation', backref='user', lazy=True)
+    # Generation history grows without bound, so it's a query (newest first)
+    # that callers can .limit() rather than a list loaded in full
+    generations = db.relationship('Generation', backref='user', lazy='dynamic',
+                                  order_by='Generation.created_at.desc()')
 
     def __repr__(self):
         return f'<User {self.email}>'
@@ -28,11 +31,15 @@ class User(db.Model):
 class Purchase(db.Model):
     """Track credit purchases."""
     __tablename__ = 'purchases'
+    __table_args__ = (
+        # A user's purchases by status (also covers lookups by user_id alone)
+        db.Index('ix_purchases_user_status', 'user_id', 'status'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    stripe_session_id = db.Column(db.String(255), unique=True)
-    stripe_payment_intent = db.Column(db.String(255))
+    stripe_session_id = db.Column(db.String(255), unique=True, index=True)  # webhook/success lookups
+    stripe_payment_intent = db.Column(db.String(255), index=True)
     credits_purchased = db.Column(db.Integer, nullable=False)
     amount_cents = db.Column(db.Integer, nullable=False)  # Amount in cents
     status = db.Column(db.String(50), default='pending')  # pending, completed, failed
@@ -45,13 +52,17 @@ class Purchase(db.Model):
 class Generation(db.Model):
     """Track digest generations for usage history."""
     __tablename__ = 'generations'
+    __table_args__ = (
+        # A user's history, newest first (also covers lookups by user_id alone)
+        db.Index('ix_generations_user_id_created_at', 'user_id', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     url = db.Column(db.String(500))
     article_count = db.Column(db.Integer)
     output_type = db.Column(db.String(50))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
     def __repr__(self):
         return f'<Generation {self.id} - {self.url}>'
@@ -1,8 +1,11 @@
 """Stripe payment integration for credit purchases."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import stripe
-from flask import url_for
+from flask import url_for, current_app
+from sqlalchemy import update
 
 from models import db, User, Purchase
 from auth import add_credits
@@ -10,16 +13,20 @@ from auth import add_credits
 # Initialize Stripe
 stripe.api_key = os.environ.get('STRIPE_SECRET_KEY', '')
 
-# Pricing tiers (credits, price in cents, name)
-PRICING_TIERS = [
+# Processes webhook events after the 200 has been sent (Stripe retries slow
+# webhooks); one worker keeps events for the same purchase in order
+_webhook_worker = ThreadPoolExecutor(max_workers=1)
+
+# Pricing tiers (credits, price in cents, name) - static, shared by every request
+PRICING_TIERS = (
     {'credits': 1, 'price_cents': 100, 'name': '1 Generation', 'description': 'Single digest generation'},
     {'credits': 10, 'price_cents': 900, 'name': '10 Generations', 'description': 'Save 10% - $0.90 each'},
     {'credits': 100, 'price_cents': 7500, 'name': '100 Generations', 'description': 'Save 25% - $0.75 each'},
-]
+)
 
 
 def get_pricing_tiers():
-    """Return available pricing tiers."""
+    """Return available pricing tiers (the module-level tuple, never rebuilt)."""
     return PRICING_TIERS
 
 
@@ -74,11 +81,15 @@ def create_checkout_session(user: User, tier_index: int, success_url: str, cance
         return None
 
 
-def handle_successful_payment(session_id: str) -> bool:
-    """Handle a successful payment by adding credits to the user."""
+def handle_successful_payment(session_id: str, checkout_session=None) -> bool:
+    """Handle a successful payment by adding credits to the user.
+
+    Pass checkout_session when the Checkout Session object is already at hand
+    (e.g. from a verified webhook payload) to skip retrieving it from Stripe.
+    """
     try:
         # Retrieve the session from Stripe
-        session = stripe.checkout.Session.retrieve(session_id)
+        session = checkout_session or stripe.checkout.Session.retrieve(session_id)
 
         if session.payment_status != 'paid':
             return False
@@ -88,15 +99,19 @@ def handle_successful_payment(session_id: str) -> bool:
         if not purchase:
             return False
 
-        # Check if already processed
-        if purchase.status == 'completed':
+        # The webhook and the success page usually arrive together, on
+        # different threads: claim the purchase with one conditional UPDATE so
+        # only one of them credits it
+        claimed = db.session.execute(
+            update(Purchase)
+            .where(Purchase.id == purchase.id, Purchase.status != 'completed')
+            .values(status='completed', stripe_payment_intent=session.payment_intent)
+        )
+        if claimed.rowcount != 1:
+            db.session.rollback()
             return True  # Already processed, just return success
 
-        # Update purchase status
-        purchase.status = 'completed'
-        purchase.stripe_payment_intent = session.payment_intent
-
-        # Add credits to user
+        # Add credits to user (add_credits commits the claim with them)
         user = User.query.get(purchase.user_id)
         if user:
             add_credits(user, purchase.credits_purchased)
@@ -121,6 +136,15 @@ def handle_webhook_event(payload: bytes, sig_header: str, webhook_secret: str) -
     # Handle the checkout.session.completed event
     if event['type'] == 'checkout.session.completed':
         session = event['data']['object']
-        handle_successful_payment(session['id'])
+        _webhook_worker.submit(_process_completed_checkout, current_app._get_current_object(), session)
 
     return True
+
+
+def _process_completed_checkout(app, checkout_session):
+    """Credit a completed checkout from a webhook (runs off the request thread)."""
+    try:
+        with app.app_context():
+            handle_successful_payment(checkout_session['id'], checkout_session)
+    except Exception as e:
+        print(f"Failed to process checkout {checkout_session['id']}: {e}")
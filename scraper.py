@@ -1,23 +1,234 @@
 """Web scraping module for extracting articles from websites."""
 
 import html
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
 
+from cache import TTLCache
 from config import (
     USER_AGENT,
     REQUEST_TIMEOUT,
     MAX_RETRIES,
     RETRY_DELAY,
+    MAX_CONCURRENT_FETCHES,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    MAX_PAGE_BYTES,
+    PAGE_CACHE_TTL,
+    PAGE_CACHE_SIZE,
+    PAGE_CACHE_MAX_BYTES,
+    REQUESTS_PER_SECOND,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_COOLDOWN,
+    ROBOTS_CACHE_TTL,
+    PROMPT_CONTENT_CHARS,
+    PROMPT_TAIL_CHARS,
 )
 
 
-@dataclass
+# Schemes accepted as-is; anything else gets https:// prepended
+URL_SCHEMES = ("http://", "https://")
+
+# Article page selectors, tried in priority order. Compiled once at import so
+# each scraped page doesn't re-parse the selector strings.
+TITLE_SELECTORS = (
+    "h1.entry-title",
+    "h1.post-title",
+    "h1.article-title",
+    "article h1",
+    ".post h1",
+    "main h1",
+    "h1",
+)
+
+AUTHOR_SELECTORS = (
+    ".author-name",
+    ".post-author",
+    ".entry-author",
+    ".byline",
+    "[rel='author']",
+    ".author",
+    "[class*='author']",
+)
+
+# Order matters: more specific selectors first, then generic ones
+CONTENT_SELECTORS = (
+    # Webflow-specific (used by sites like Unchained)
+    ".blog-content__copy",
+    ".w-richtext",
+    # Common blog platforms
+    ".entry-content",
+    ".post-content",
+    ".article-content",
+    ".post-body",
+    ".blog-post-content",
+    ".article-body",
+    ".story-content",
+    ".post__content",
+    ".content-body",
+    # Generic patterns
+    "article .content",
+    "[class*='post-content']",
+    "[class*='article-content']",
+    "[class*='entry-content']",
+    "[class*='blog-content']",
+    "article",
+)
+
+_TITLE_SELECTORS = [soupsieve.compile(s) for s in TITLE_SELECTORS]
+_AUTHOR_SELECTORS = [soupsieve.compile(s) for s in AUTHOR_SELECTORS]
+_CONTENT_SELECTORS = [soupsieve.compile(s) for s in CONTENT_SELECTORS]
+
+# Each group combined into one selector list, so a page is walked once per group
+_TITLE_CANDIDATES = soupsieve.compile(", ".join(TITLE_SELECTORS))
+_AUTHOR_CANDIDATES = soupsieve.compile(", ".join(AUTHOR_SELECTORS))
+_CONTENT_CANDIDATES = soupsieve.compile(", ".join(CONTENT_SELECTORS))
+
+# Listing page selectors, tried in order by _extract_article_links
+FEATURED_SELECTORS = (".today-featured-card", "[class*='featured-card']", "[class*='hero-card']")
+
+# Card-based layouts (like Mere Orthodoxy, Unchained)
+CARD_SELECTORS = (
+    ".section--listing--card",
+    ".post-card",
+    ".article-card",
+    ".entry-card",
+    ".blog-card",
+    "[class*='blog-card']",
+    "[class*='post-card']",
+    "[class*='article-card']",
+    "[class*='card']",
+)
+
+# Article/post containers
+CONTAINER_SELECTORS = (
+    "article",
+    ".post",
+    ".entry",
+    ".blog-post",
+    ".article-item",
+    "[class*='post']",
+    "[class*='article']",
+)
+
+_FEATURED_SELECTORS = [soupsieve.compile(s) for s in FEATURED_SELECTORS]
+_CARD_SELECTORS = [soupsieve.compile(s) for s in CARD_SELECTORS]
+_CONTAINER_SELECTORS = [soupsieve.compile(s) for s in CONTAINER_SELECTORS]
+
+# Tags removed from an element before its text is extracted
+_NON_CONTENT_TAGS = frozenset(("script", "style", "nav", "footer", "header"))
+
+# Runs of whitespace, collapsed to a single space in extracted text
+_WS_RE = re.compile(r"\s+")
+
+# Byline prefixes stripped from author names
+_AUTHOR_PREFIX_RE = re.compile(r"\b(?:written by|by|author:)\s+", re.IGNORECASE)
+
+# Common words/phrases that end up in author elements (case-insensitive)
+AUTHOR_NOISE_PATTERNS = (
+    "About the Author",
+    "About the Authors",
+    "About",
+    "Follow on Twitter",
+    "Follow on X",
+    "Follow",
+    "Subscribe",
+    "Share",
+    "Twitter",
+    "Facebook",
+    "LinkedIn",
+    "Email",
+    "More articles",
+    "View all posts",
+    "Read more",
+    "Contact",
+)
+
+# Longest alternatives first so "About the Authors" wins over "About";
+# " | " and " - " separators are matched alongside them
+_AUTHOR_NOISE_RE = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(p) for p in sorted(AUTHOR_NOISE_PATTERNS, key=len, reverse=True))
+    + r")\b|\s[|-]\s",
+    re.IGNORECASE,
+)
+
+# URL fragments marking tag, category and utility pages (matched case-insensitively)
+SKIP_URL_PATTERNS = (
+    "/tag/", "/tags/", "/category/", "/categories/",
+    "/author/", "/page/", "/search", "/login", "/signup",
+    "/contact", "/about", "/privacy", "/terms", "/subscribe",
+    "/feed", "/rss", "#", "javascript:", "mailto:",
+    # Additional patterns for sites like Unchained that use blog- prefix
+    "/blog-tag/", "/blog-category/", "/blog-author/",
+    "-tag/", "-category/", "-author/",
+    # Substack utility pages
+    "/archive", "/recommendations", "/podcast", "/notes",
+)
+_SKIP_URL_RE = re.compile("|".join(re.escape(p) for p in SKIP_URL_PATTERNS), re.IGNORECASE)
+
+
+# Tags and class fragments the article selectors above can reach; an article
+# page's tree is built only from subtrees rooted at such an element
+_ARTICLE_TAGS = frozenset(("article", "main", "h1"))
+_ARTICLE_CLASS_RE = re.compile(r"post|article|entry|blog|content|story|richtext|author|byline")
+
+
+class _ArticleStrainer(ElementFilter):
+    """Parse-time filter that skips page chrome (nav, ads, scripts) on article pages.
+
+    A SoupStrainer can't express "tag name OR class OR rel", so this checks
+    the raw start-tag attributes directly. Beautiful Soup only consults it for
+    top-level elements; once an element is kept, its whole subtree is kept.
+    """
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name in _ARTICLE_TAGS:
+            return True
+        if not attrs:
+            return False
+        if "author" in str(attrs.get("rel", "")):
+            return True
+        return _ARTICLE_CLASS_RE.search(str(attrs.get("class", ""))) is not None
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+
+_ARTICLE_STRAINER = _ArticleStrainer()
+
+
+def _select_by_priority(soup, candidates_selector, selectors):
+    """Yield the first element matching each selector, in selector priority order.
+
+    Equivalent to calling select_one() with each selector in turn, but the tree
+    is walked once: the combined selector collects every candidate in document
+    order, and each selector is then only matched against those candidates.
+    """
+    candidates = candidates_selector.select(soup)
+    for selector in selectors:
+        for elem in candidates:
+            if selector.match(elem):
+                yield elem
+                break
+
+
+@dataclass(slots=True)
 class Article:
     """Represents a scraped article."""
     title: str
@@ -25,36 +236,241 @@ class Article:
     content: str
     url: str
 
+    def content_for_prompt(self, max_chars: int = PROMPT_CONTENT_CHARS) -> str:
+        """Return the article text as it is sent to Claude (about max_chars characters).
+
+        Longer text keeps its opening and its ending, which between them usually
+        carry the thesis, with the middle elided. Both cuts fall on word boundaries.
+        """
+        if len(self.content) <= max_chars:
+            return self.content
+        tail_chars = min(PROMPT_TAIL_CHARS, max_chars // 3)
+        head = self.content[:max_chars - tail_chars].rsplit(" ", 1)[0]
+        tail = self.content[-tail_chars:].split(" ", 1)[-1]
+        return f"{head} [...] {tail}"
+
+
+def normalize_url(url: str) -> str:
+    """Strip a user-supplied URL and default it to https:// when it has no scheme."""
+    url = url.strip()
+    if url and not url.startswith(URL_SCHEMES):
+        url = "https://" + url
+    return url
+
+
+def _join_url(base_url: str, href: str) -> str:
+    """Resolve an href against the base URL (absolute hrefs are returned as-is)."""
+    if href.startswith(URL_SCHEMES):
+        return href
+    return _cached_urljoin(base_url, href)
+
+
+@lru_cache(maxsize=2048)
+def _cached_urljoin(base_url: str, href: str) -> str:
+    # Listing pages repeat the same relative hrefs (nav, cards, "read more" links)
+    return urljoin(base_url, href)
+
+
+def _is_dns_error(error: Exception) -> bool:
+    """Check whether an error is a DNS/resolution failure (no point retrying)."""
+    error_str = str(error).lower()
+    return "resolve" in error_str or "nodename" in error_str or "name resolution" in error_str
+
+
+# Longest Retry-After we honor: a host asking for more would otherwise park a
+# fetch thread inside urllib3, out of reach of REQUEST_TIMEOUT and the breaker
+_MAX_RETRY_AFTER = RETRY_DELAY * 2 ** MAX_RETRIES
+
+
+class _Retry(Retry):
+    """urllib3 retry policy that gives up at once on DNS failures and caps Retry-After waits."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, _MAX_RETRY_AFTER)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if error is not None and _is_dns_error(error):
+            raise MaxRetryError(_pool, url, error) from error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def _build_session() -> requests.Session:
+    """Create the pooled HTTP session shared by all scrapers."""
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+    })
+    # Connection errors, timeouts and transient statuses are retried inside
+    # urllib3 with exponential backoff (honoring Retry-After on 429/503, up
+    # to _MAX_RETRY_AFTER).
+    # The final 5xx response is returned rather than raised, so
+    # raise_for_status reports the real status.
+    retries = _Retry(
+        total=MAX_RETRIES - 1,
+        backoff_factor=RETRY_DELAY,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _HostRateLimiter:
+    """Spaces out request starts to each host to at most `rate` per second.
+
+    Replaces a fixed sleep after every article: concurrent fetches queue for
+    their own slot, so politeness holds without serializing the scrape.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        """Block until a request to url's host may start."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            if len(self._next_slot) > 1024:
+                # Forget hosts that haven't been contacted recently
+                self._next_slot = {h: t for h, t in self._next_slot.items() if t > now}
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _CircuitBreaker:
+    """Fails fast for hosts whose fetches keep failing.
+
+    After `threshold` consecutive failed fetches (each already retried) the
+    host's circuit opens and fetches are refused for `cooldown` seconds. Then
+    a single probe is let through; success closes the circuit, failure
+    re-opens it.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._hosts = {}  # host -> [consecutive failures, opened_at, probe in flight]
+        self._lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        """Check whether a fetch to host may be attempted now."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state[0] < self.threshold:
+                return True
+            _, opened_at, probing = state
+            if probing or time.monotonic() - opened_at < self.cooldown:
+                return False
+            state[2] = True
+            return True
+
+    def record_success(self, host: str):
+        """Close the host's circuit."""
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def release(self, host: str):
+        """End a probe that gave no verdict on the host, so a later fetch can probe again."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is not None:
+                state[2] = False
+
+    def record_failure(self, host: str):
+        """Count a failed fetch, opening the circuit at the threshold."""
+        with self._lock:
+            state = self._hosts.setdefault(host, [0, 0.0, False])
+            state[0] += 1
+            if state[0] >= self.threshold:
+                state[1] = time.monotonic()
+                state[2] = False
+
+
+def _is_server_failure(error: requests.RequestException) -> bool:
+    """Check whether an error says the host is unhealthy (vs. e.g. a 404)."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
 
 class ArticleScraper:
     """Scrapes articles from websites."""
 
+    # Shared across instances so keep-alive connections (and their TLS
+    # handshakes) survive from one scrape/request to the next
+    _session = _build_session()
+
+    # url -> (etag, last_modified, body, encoding) of recently fetched pages,
+    # revalidated with a conditional GET instead of downloaded again
+    _page_cache = TTLCache(maxsize=PAGE_CACHE_SIZE, ttl=PAGE_CACHE_TTL)
+
+    # Per-host politeness, shared so simultaneous scrapes of a site add up
+    _rate_limiter = _HostRateLimiter(REQUESTS_PER_SECOND)
+
+    # Stops a dead or overloaded site from costing every article a full retry cycle
+    _circuit_breaker = _CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN)
+
+    # Parsed robots.txt per site origin
+    _robots_cache = TTLCache(maxsize=256, ttl=ROBOTS_CACHE_TTL)
+
     def __init__(self, base_url: str):
+        self._set_base_url(base_url)
+        self.session = ArticleScraper._session
+
+    def _set_base_url(self, base_url: str):
+        """Set the site URL and cache the parts link filtering compares against."""
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        })
-
-    def _fetch_page(self, url: str, allow_www_fallback: bool = True) -> Optional[BeautifulSoup]:
-        """Fetch a page with retry logic."""
-        last_error = None
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
-                return BeautifulSoup(response.text, "lxml")
-            except requests.RequestException as e:
-                last_error = e
-                # Check if it's a DNS/resolution error - no point retrying
-                error_str = str(e).lower()
-                if "resolve" in error_str or "nodename" in error_str or "name resolution" in error_str:
-                    break  # Skip retries for DNS errors
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))
+        parsed = urlparse(base_url)
+        self._base_domain = parsed.netloc
+        self._base_prefix = f"{parsed.scheme}://{parsed.netloc}"
+
+    def _is_same_site(self, full_url: str) -> bool:
+        """Check whether a resolved link points at the site being scraped."""
+        # Links resolved against base_url nearly always start with its origin,
+        # which saves parsing them
+        if full_url.startswith(self._base_prefix):
+            return True
+        return self._base_domain in urlparse(full_url).netloc
+
+    def _fetch_page(self, url: str, allow_www_fallback: bool = True,
+                    parse_only: Optional[ElementFilter] = None) -> Optional[BeautifulSoup]:
+        """Fetch a page with retry logic, optionally parsing only part of it."""
+        host = urlparse(url).netloc
+        if not self._circuit_breaker.allow(host):
+            raise RuntimeError(f"Skipping {url}: {host} keeps failing, waiting before trying it again")
+
+        # Retries happen in the session's adapter (see _build_session)
+        try:
+            body, encoding = self._download(url)
+        except requests.RequestException as e:
+            last_error = e
+            # A client error such as a 404 still means the host itself is up
+            if _is_server_failure(e):
+                self._circuit_breaker.record_failure(host)
+            else:
+                self._circuit_breaker.record_success(host)
+        except BaseException:
+            # Not a verdict on the host (e.g. a decoding bug or Ctrl-C), but a
+            # probe must not stay in flight or the host is blocked for good
+            self._circuit_breaker.release(host)
+            raise
+        else:
+            self._circuit_breaker.record_success(host)
+            return BeautifulSoup(body, "lxml", from_encoding=encoding, parse_only=parse_only)
 
         # If we got here, all attempts failed. Try www. fallback if applicable
         if allow_www_fallback and url == self.base_url:
@@ -64,92 +480,124 @@ class ArticleScraper:
                 if parsed.query:
                     www_url += f"?{parsed.query}"
                 try:
-                    response = self.session.get(www_url, timeout=REQUEST_TIMEOUT)
-                    response.raise_for_status()
+                    body, encoding = self._download(www_url)
                     # Update base_url to use www version
-                    self.base_url = www_url
-                    return BeautifulSoup(response.text, "lxml")
+                    self._set_base_url(www_url)
+                    return BeautifulSoup(body, "lxml", from_encoding=encoding, parse_only=parse_only)
                 except requests.RequestException:
                     pass  # Fall through to original error
 
-        raise RuntimeError(f"Failed to fetch {url} after {MAX_RETRIES} attempts: {last_error}")
+        raise RuntimeError(f"Failed to fetch {url}: {last_error}")
+
+    def _download(self, url: str) -> tuple[bytes, Optional[str]]:
+        """GET a page body and its declared encoding, revalidating any cached copy."""
+        cached = self._page_cache.get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, cached_body, cached_encoding = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        self._rate_limiter.wait(url)
+        with self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            if cached and response.status_code == 304:
+                return cached_body, cached_encoding
+            response.raise_for_status()
+
+            # Don't start reading a body we'd have to truncate anyway. With gzip
+            # this is the compressed size, so an over-limit value is still conclusive.
+            content_length = response.headers.get("Content-Length", "")
+            if content_length.isdigit() and int(content_length) > MAX_PAGE_BYTES:
+                raise requests.RequestException(
+                    f"Page too large ({int(content_length):,} bytes)", response=response
+                )
+            body = self._read_body(response)
+
+            # Hand lxml the raw bytes so it decodes once. Only pass the header
+            # charset if the server sent one; otherwise requests would guess
+            # ISO-8859-1 and override the page's own <meta charset>.
+            content_type = response.headers.get("Content-Type", "").lower()
+            encoding = response.encoding if "charset=" in content_type else None
+
+            # Keep validatable pages so the next fetch can be a 304; only small
+            # ones, since every entry holds a whole body (and a truncated one
+            # couldn't be revalidated anyway)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if (etag or last_modified) and len(body) <= PAGE_CACHE_MAX_BYTES:
+                self._page_cache.set(url, (etag, last_modified, body, encoding))
+
+        return body, encoding
+
+    def _read_body(self, response: requests.Response) -> bytes:
+        """Read a streamed response body, stopping at MAX_PAGE_BYTES."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_PAGE_BYTES:
+                break
+        return b"".join(chunks)[:MAX_PAGE_BYTES]
 
     def _check_robots_txt(self) -> bool:
-        """Check if scraping is allowed by robots.txt."""
-        try:
-            parsed = urlparse(self.base_url)
-            robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-            response = self.session.get(robots_url, timeout=10)
-            if response.status_code == 200:
-                content = response.text.lower()
-                if "disallow: /" in content and "user-agent: *" in content:
-                    lines = content.split("\n")
-                    for i, line in enumerate(lines):
-                        if "user-agent: *" in line:
-                            for j in range(i + 1, min(i + 5, len(lines))):
-                                if lines[j].strip() == "disallow: /":
-                                    return False
-            return True
-        except requests.RequestException:
-            return True
+        """Check if scraping the site's URL is allowed by robots.txt."""
+        return self._robots_for(self._base_prefix).can_fetch(USER_AGENT, self.base_url)
+
+    def _robots_for(self, origin: str) -> RobotFileParser:
+        """Get the parsed robots.txt for a scheme://host origin (cached)."""
+        robots = self._robots_cache.get(origin)
+        if robots is None:
+            robots_url = f"{origin}/robots.txt"
+            robots = RobotFileParser(robots_url)
+            try:
+                # Fetched through the session (timeout, user agent, pooling)
+                # rather than RobotFileParser.read()
+                response = self.session.get(robots_url, timeout=10)
+                if response.status_code == 200:
+                    robots.parse(response.text.splitlines())
+                else:
+                    robots.allow_all = True  # No robots.txt (or unreadable): no restrictions
+            except requests.RequestException:
+                robots.allow_all = True
+            self._robots_cache.set(origin, robots)
+        return robots
 
     def _extract_text(self, element) -> str:
         """Extract clean text from a BeautifulSoup element."""
         if element is None:
             return ""
-        for script in element(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
+        # One walk with a set lookup per tag; matching five tag names in
+        # find_all (or a CSS selector) is several times slower
+        for tag in [tag for tag in element.find_all(True) if tag.name in _NON_CONTENT_TAGS]:
+            tag.decompose()
         text = element.get_text(separator=" ", strip=True)
-        # Decode HTML entities like &#39; -> ' and &amp; -> &
-        text = html.unescape(text)
-        return " ".join(text.split())
+        # Decode HTML entities like &#39; -> ' and &amp; -> & (rarely present)
+        if "&" in text:
+            text = html.unescape(text)
+        return _WS_RE.sub(" ", text).strip()
+
+    def _content_from(self, element) -> str:
+        """Join the text of an element's paragraphs (or its whole text if it has none)."""
+        paragraphs = element.find_all("p")
+        if not paragraphs:
+            return self._extract_text(element)
+        texts = (self._extract_text(p) for p in paragraphs)
+        return " ".join(text for text in texts if text)
 
     def _clean_author_name(self, author: str) -> str:
         """Clean author name by removing common extraneous text like 'About', 'Follow', etc."""
         if not author:
             return ""
 
-        # Remove common prefixes
-        author = author.replace("By ", "").replace("by ", "")
-        author = author.replace("Written by ", "").replace("written by ", "")
-        author = author.replace("Author: ", "").replace("author: ", "")
-
-        # Common words/phrases to remove (case-insensitive patterns)
-        remove_patterns = [
-            "About the Author",
-            "About the Authors",
-            "About",
-            "Follow on Twitter",
-            "Follow on X",
-            "Follow",
-            "Subscribe",
-            "Share",
-            "Twitter",
-            "Facebook",
-            "LinkedIn",
-            "Email",
-            "More articles",
-            "View all posts",
-            "Read more",
-            "Contact",
-            " | ",
-            " - ",
-        ]
-
-        # Sort by length descending to remove longer patterns first
-        remove_patterns.sort(key=len, reverse=True)
-
-        for pattern in remove_patterns:
-            # Case-insensitive replacement
-            lower_author = author.lower()
-            lower_pattern = pattern.lower()
-            while lower_pattern in lower_author:
-                idx = lower_author.find(lower_pattern)
-                author = author[:idx] + author[idx + len(pattern):]
-                lower_author = author.lower()
+        # Remove byline prefixes and common extraneous words/phrases in one pass each
+        author = _AUTHOR_PREFIX_RE.sub("", author)
+        author = _AUTHOR_NOISE_RE.sub(" ", author)
 
         # Clean up multiple spaces and trim
-        author = " ".join(author.split()).strip()
+        author = _WS_RE.sub(" ", author).strip()
 
         # If author contains multiple names separated by commas or 'and', that's fine
         # But if it's too long (likely contains extra junk), try to extract just the name part
@@ -176,31 +624,19 @@ class ArticleScraper:
         while " &  & " in author or "& &" in author:
             author = author.replace(" &  & ", " & ").replace("& &", "&")
         author = author.replace("  &", " &").replace("&  ", "& ")
-        author = " ".join(author.split()).strip()
+        author = _WS_RE.sub(" ", author).strip()
 
         return author.strip()
 
     def _is_article_url(self, url: str) -> bool:
         """Check if a URL looks like an article (not a tag, category, or utility page)."""
-        skip_patterns = [
-            "/tag/", "/tags/", "/category/", "/categories/",
-            "/author/", "/page/", "/search", "/login", "/signup",
-            "/contact", "/about", "/privacy", "/terms", "/subscribe",
-            "/feed", "/rss", "#", "javascript:", "mailto:",
-            # Additional patterns for sites like Unchained that use blog- prefix
-            "/blog-tag/", "/blog-category/", "/blog-author/",
-            "-tag/", "-category/", "-author/",
-            # Substack utility pages
-            "/archive", "/recommendations", "/podcast", "/notes"
-        ]
-        url_lower = url.lower()
-        return not any(pattern in url_lower for pattern in skip_patterns)
+        return _SKIP_URL_RE.search(url) is None
 
     def _is_substack_article_url(self, url: str) -> bool:
         """Check if a URL is a Substack article URL (contains /p/)."""
         return "/p/" in url.lower()
 
-    def _extract_link_from_card(self, card, base_domain: str) -> Optional[str]:
+    def _extract_link_from_card(self, card) -> Optional[str]:
         """Extract an article link from a card element, checking both inside and parent."""
         # First check for a link inside the card
         link = card.find("a", href=True)
@@ -211,93 +647,70 @@ class ArticleScraper:
                 link = parent
         if link:
             href = link.get("href", "")
-            full_url = urljoin(self.base_url, href)
-            parsed_url = urlparse(full_url)
-            if (self._is_article_url(full_url) and
-                base_domain in parsed_url.netloc):
+            full_url = _join_url(self.base_url, href)
+            if self._is_article_url(full_url) and self._is_same_site(full_url):
                 return full_url
         return None
 
-    def _extract_article_links(self, soup: BeautifulSoup) -> list[str]:
-        """Extract article links from the main page."""
-        links = []
-        parsed_base = urlparse(self.base_url)
-        base_domain = parsed_base.netloc
+    def _extract_article_links(self, soup: BeautifulSoup, limit: Optional[int] = None) -> list[str]:
+        """Extract article links from the main page, stopping after `limit` links if given."""
+        max_links = limit or float("inf")
+
+        # Dicts used as insertion-ordered sets: duplicate links are dropped in
+        # O(1) instead of scanning the list collected so far
+        links = {}
 
         # Collect featured/hero article links separately so they don't prevent
         # finding the rest of the articles via later strategies.
-        featured_links = []
-        featured_selectors = [".today-featured-card", "[class*='featured-card']", "[class*='hero-card']"]
-        for selector in featured_selectors:
-            for card in soup.select(selector):
-                full_url = self._extract_link_from_card(card, base_domain)
-                if full_url and full_url not in featured_links:
-                    featured_links.append(full_url)
+        featured_links = {}
+        for selector in _FEATURED_SELECTORS:
+            for card in selector.select(soup):
+                full_url = self._extract_link_from_card(card)
+                if full_url:
+                    featured_links[full_url] = None
 
         # Strategy 0: Look for Substack article links (/p/ pattern)
         for link in soup.find_all("a", href=True):
             href = link.get("href", "")
-            full_url = urljoin(self.base_url, href)
+            full_url = _join_url(self.base_url, href)
             if self._is_substack_article_url(full_url):
-                parsed_url = urlparse(full_url)
                 # Make sure it's on the same domain or a relative link
-                if (base_domain in parsed_url.netloc or not parsed_url.netloc) and full_url not in links:
-                    links.append(full_url)
+                if self._is_same_site(full_url) or not urlparse(full_url).netloc:
+                    links[full_url] = None
+                    if len(links) >= max_links:
+                        break
 
         if links:
             # Prepend featured links that aren't already in the list
-            for fl in reversed(featured_links):
-                if fl not in links:
-                    links.insert(0, fl)
-            return links
+            return self._with_featured(featured_links, links)
 
         # Strategy 1: Look for card-based layouts (like Mere Orthodoxy, Unchained)
-        card_selectors = [
-            ".section--listing--card",
-            ".post-card",
-            ".article-card",
-            ".entry-card",
-            ".blog-card",
-            "[class*='blog-card']",
-            "[class*='post-card']",
-            "[class*='article-card']",
-            "[class*='card']"
-        ]
-
-        for selector in card_selectors:
-            cards = soup.select(selector)
+        for selector in _CARD_SELECTORS:
+            cards = selector.select(soup)
             if cards:
                 for card in cards:
-                    full_url = self._extract_link_from_card(card, base_domain)
-                    if full_url and full_url not in links:
-                        links.append(full_url)
+                    full_url = self._extract_link_from_card(card)
+                    if full_url:
+                        links[full_url] = None
+                        if len(links) >= max_links:
+                            break
                 if links:
                     break
 
         # Strategy 2: Look for article/post containers
         if not links:
-            container_selectors = [
-                "article",
-                ".post",
-                ".entry",
-                ".blog-post",
-                ".article-item",
-                "[class*='post']",
-                "[class*='article']"
-            ]
-
-            for selector in container_selectors:
-                containers = soup.select(selector)
+            for selector in _CONTAINER_SELECTORS:
+                containers = selector.select(soup)
                 if containers:
                     for container in containers:
                         link = container.find("a", href=True)
                         if link:
                             href = link.get("href", "")
-                            full_url = urljoin(self.base_url, href)
-                            if (self._is_article_url(full_url) and
-                                base_domain in urlparse(full_url).netloc and
-                                full_url not in links):
-                                links.append(full_url)
+                            full_url = _join_url(self.base_url, href)
+                            if self._is_article_url(full_url) and self._is_same_site(full_url):
+                                links[full_url] = None
+                                if len(links) >= max_links:
+                                    break
                     if links:
                         break
 
@@ -307,27 +720,26 @@ class ArticleScraper:
             if main_content:
                 for link in main_content.find_all("a", href=True):
                     href = link.get("href", "")
-                    full_url = urljoin(self.base_url, href)
-                    parsed_url = urlparse(full_url)
+                    full_url = _join_url(self.base_url, href)
+                    if not (self._is_article_url(full_url) and self._is_same_site(full_url)):
+                        continue
 
                     # Check if it looks like an article URL (has path segments)
-                    path_parts = [p for p in parsed_url.path.split("/") if p]
-                    if (len(path_parts) >= 1 and
-                        self._is_article_url(full_url) and
-                        base_domain in parsed_url.netloc and
-                        full_url not in links):
-                        links.append(full_url)
+                    path_parts = [p for p in urlparse(full_url).path.split("/") if p]
+                    if len(path_parts) >= 1:
+                        links[full_url] = None
+                        if len(links) >= max_links:
+                            break
 
         # Strategy 4: Look for any links with article-like patterns in the entire page
         # This helps with blog subpages like /blog that may have different structures
         if not links:
             for link in soup.find_all("a", href=True):
                 href = link.get("href", "")
-                full_url = urljoin(self.base_url, href)
-                parsed_url = urlparse(full_url)
+                full_url = _join_url(self.base_url, href)
 
                 # Must be on same domain
-                if base_domain not in parsed_url.netloc:
+                if not self._is_same_site(full_url):
                     continue
 
                 # Skip if not article-like
@@ -335,7 +747,7 @@ class ArticleScraper:
                     continue
 
                 # Look for URLs that have date patterns or /blog/ prefix with slug
-                path = parsed_url.path.lower()
+                path = urlparse(full_url).path.lower()
                 path_parts = [p for p in path.split("/") if p]
 
                 # Skip if it's just the blog index
@@ -345,123 +757,83 @@ class ArticleScraper:
                 # Accept URLs like /blog/article-slug or /2024/01/article-slug
                 if len(path_parts) >= 2:
                     # Has multiple path segments (likely an article)
-                    if full_url not in links:
-                        links.append(full_url)
+                    links[full_url] = None
+                    if len(links) >= max_links:
+                        break
 
         # Prepend any featured article links found earlier
-        for fl in reversed(featured_links):
-            if fl not in links:
-                links.insert(0, fl)
+        return self._with_featured(featured_links, links)
 
-        return links
+    def _with_featured(self, featured_links: dict, links: dict) -> list[str]:
+        """Put featured links not already found first, keeping both orders."""
+        return [fl for fl in featured_links if fl not in links] + list(links)
 
     def _scrape_article_page(self, url: str) -> Optional[Article]:
         """Scrape a single article page."""
         try:
-            soup = self._fetch_page(url)
+            soup = self._fetch_page(url, parse_only=_ARTICLE_STRAINER)
             if not soup:
                 return None
 
-            # Extract title - try multiple approaches
-            title = ""
-            title_selectors = [
-                "h1.entry-title",
-                "h1.post-title",
-                "h1.article-title",
-                "article h1",
-                ".post h1",
-                "main h1",
-                "h1"
-            ]
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title = self._extract_text(title_elem)
-                    if title and len(title) < 300:
-                        break
+            try:
+                return self._extract_article(soup, url)
+            finally:
+                # Only plain strings outlive extraction. Tearing the tree down
+                # now breaks its parent/child reference cycles, so each page's
+                # nodes are freed immediately instead of by the cyclic GC.
+                soup.decompose()
 
-            # Extract author - try multiple approaches
-            author = ""
-            author_selectors = [
-                ".author-name",
-                ".post-author",
-                ".entry-author",
-                ".byline",
-                "[rel='author']",
-                ".author",
-                "[class*='author']"
-            ]
-            for selector in author_selectors:
-                author_elem = soup.select_one(selector)
-                if author_elem:
-                    author = self._extract_text(author_elem)
-                    author = self._clean_author_name(author)
-                    if author and len(author) < 100:
-                        break
+        except Exception as e:
+            print(f"  Warning: Failed to scrape {url}: {e}")
+            return None
 
-            if not author:
-                author = "Unknown Author"
-
-            # Extract content - try multiple approaches
-            # Order matters: more specific selectors first, then generic ones
-            content = ""
-            content_selectors = [
-                # Webflow-specific (used by sites like Unchained)
-                ".blog-content__copy",
-                ".w-richtext",
-                # Common blog platforms
-                ".entry-content",
-                ".post-content",
-                ".article-content",
-                ".post-body",
-                ".blog-post-content",
-                ".article-body",
-                ".story-content",
-                ".post__content",
-                ".content-body",
-                # Generic patterns
-                "article .content",
-                "[class*='post-content']",
-                "[class*='article-content']",
-                "[class*='entry-content']",
-                "[class*='blog-content']",
-                "article",
-            ]
-
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    # Get all paragraphs within the content area
-                    paragraphs = content_elem.find_all("p")
-                    if paragraphs:
-                        content = " ".join(self._extract_text(p) for p in paragraphs if self._extract_text(p))
-                    else:
-                        content = self._extract_text(content_elem)
-
-                    if content and len(content) > 200:
-                        break
+    def _extract_article(self, soup: BeautifulSoup, url: str) -> Optional[Article]:
+        """Extract an Article from a parsed article page, or None if it doesn't look like one."""
+        # Extract title - try multiple approaches
+        title = ""
+        for title_elem in _select_by_priority(soup, _TITLE_CANDIDATES, _TITLE_SELECTORS):
+            title = self._extract_text(title_elem)
+            if title and len(title) < 300:
+                break
 
-            # Fallback: get all paragraphs in main/article
-            if not content or len(content) < 200:
-                main_elem = soup.find("article") or soup.find("main") or soup.find(class_="post")
-                if main_elem:
-                    paragraphs = main_elem.find_all("p")
-                    content = " ".join(self._extract_text(p) for p in paragraphs if self._extract_text(p))
+        # Extract author - try multiple approaches
+        author = ""
+        for author_elem in _select_by_priority(soup, _AUTHOR_CANDIDATES, _AUTHOR_SELECTORS):
+            author = self._extract_text(author_elem)
+            author = self._clean_author_name(author)
+            if author and len(author) < 100:
+                break
 
-            if not title or not content or len(content) < 100:
-                return None
+        if not author:
+            author = "Unknown Author"
+
+        # Extract content - try multiple approaches, remembering each
+        # element's text so the fallback never extracts the same one twice
+        content = ""
+        tried = {}
+        for content_elem in _select_by_priority(soup, _CONTENT_CANDIDATES, _CONTENT_SELECTORS):
+            content = tried[id(content_elem)] = self._content_from(content_elem)
+            if content and len(content) > 200:
+                break
 
-            return Article(
-                title=title[:500],
-                author=author[:100],
-                content=content[:10000],
-                url=url
-            )
+        # Fallback: get all paragraphs in main/article
+        if not content or len(content) < 200:
+            main_elem = soup.find("article") or soup.find("main") or soup.find(class_="post")
+            if main_elem:
+                content = tried.get(id(main_elem))
+                if content is None:
+                    content = self._content_from(main_elem)
 
-        except Exception as e:
-            print(f"  Warning: Failed to scrape {url}: {e}")
+        if not title or not content or len(content) < 100:
             return None
 
+        return Article(
+            title=title[:500],
+            author=author[:100],
+            content=content[:10000],
+            url=url
+        )
+
     def _extract_site_name(self, soup: BeautifulSoup) -> str:
         """Extract the site/publication name from the page."""
         # Try various methods to get the site name
@@ -546,7 +918,8 @@ class ArticleScraper:
         if progress_callback:
             progress_callback("Extracting article links...")
 
-        article_links = self._extract_article_links(soup)
+        # Only the first count * 2 candidates are ever scraped
+        article_links = self._extract_article_links(soup, limit=count * 2)
 
         # If no links found and it's a Substack site, try the /archive page
         if not article_links and self._is_substack_site(soup):
@@ -555,7 +928,7 @@ class ArticleScraper:
             archive_url = urljoin(self.base_url, "/archive")
             archive_soup = self._fetch_page(archive_url, allow_www_fallback=False)
             if archive_soup:
-                article_links = self._extract_article_links(archive_soup)
+                article_links = self._extract_article_links(archive_soup, limit=count * 2)
                 # Also get site name from archive page since main page is JS-only
                 site_name = self._extract_site_name(archive_soup)
 
@@ -565,19 +938,27 @@ class ArticleScraper:
         if progress_callback:
             progress_callback(f"Found {len(article_links)} potential articles. Scraping up to {count}...")
 
-        # Scrape individual articles
+        # Scrape candidates concurrently (bounded by MAX_CONCURRENT_FETCHES, which
+        # keeps the load on the server modest), but consume results in listing
+        # order so the newest articles win, and stop once we have enough.
+        candidates = article_links[:count * 2]
         articles = []
-        for i, link in enumerate(article_links[:count * 2]):
-            if len(articles) >= count:
-                break
-
-            if progress_callback:
-                progress_callback(f"Scraping article {len(articles) + 1}/{count}: {link[:60]}...")
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES)
+        try:
+            futures = [executor.submit(self._scrape_article_page, link) for link in candidates]
+            for link, future in zip(candidates, futures):
+                article = future.result()
+                if not article:
+                    continue
 
-            article = self._scrape_article_page(link)
-            if article:
                 articles.append(article)
-                time.sleep(0.5)  # Be polite to the server
+                if progress_callback:
+                    progress_callback(f"Scraped article {len(articles)}/{count}: {link[:60]}...")
+                if len(articles) >= count:
+                    break
+        finally:
+            # Drop fetches that haven't started yet
+            executor.shutdown(wait=False, cancel_futures=True)
 
         if not articles:
             raise RuntimeError("Failed to scrape any articles. The website structure may not be supported.")
@@ -589,22 +970,28 @@ class ArticleScraper:
         if not urls:
             raise ValueError("No URLs provided")
 
-        # Get site name from base URL
-        soup = self._fetch_page(self.base_url)
-        site_name = self._extract_site_name(soup) if soup else "the publication"
-
         if progress_callback:
             progress_callback(f"Scraping {len(urls)} specific articles...")
 
-        articles = []
-        for i, url in enumerate(urls):
-            if progress_callback:
-                progress_callback(f"Scraping article {i + 1}/{len(urls)}: {url[:60]}...")
+        # Fetch the base page (for the site name) alongside the articles, so the
+        # whole batch costs roughly one round-trip instead of one per URL.
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            base_future = executor.submit(self._fetch_page, self.base_url)
+            results = executor.map(self._scrape_article_page, urls)
 
-            article = self._scrape_article_page(url)
-            if article:
-                articles.append(article)
-                time.sleep(0.5)  # Be polite to the server
+            articles = []
+            for i, (url, article) in enumerate(zip(urls, results)):
+                if progress_callback:
+                    progress_callback(f"Scraped article {i + 1}/{len(urls)}: {url[:60]}...")
+                if article:
+                    articles.append(article)
+
+            try:
+                soup = base_future.result()
+            except RuntimeError:
+                soup = None
+
+        site_name = self._extract_site_name(soup) if soup else "the publication"
 
         if not articles:
             raise RuntimeError("Failed to scrape any of the provided articles.")
@@ -1,8 +1,36 @@
 """Claude API integration for generating article summaries."""
 
-from anthropic import Anthropic
-
-from config import ANTHROPIC_API_KEY, CLAUDE_MODEL, MAX_SUMMARY_WORDS
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from anthropic import DEFAULT_CONNECTION_LIMITS, Anthropic, DefaultHttpxClient
+
+from config import (
+    ANTHROPIC_API_KEY,
+    CLAUDE_MODEL,
+    FAST_MODEL,
+    MAX_SUMMARY_WORDS,
+    SUMMARY_WORD_TOLERANCE,
+    SHORTEN_MAX_TOKENS,
+    DIGEST_BASE_TOKENS,
+    DIGEST_TOKENS_PER_ARTICLE,
+    DIGEST_MAX_TOKENS,
+    SOCIAL_POST_MAX_TOKENS,
+    MAX_CONCURRENT_API_CALLS,
+    BATCH_POLL_INTERVAL,
+    API_MAX_CONNECTIONS,
+    API_KEEPALIVE_CONNECTIONS,
+    API_KEEPALIVE_EXPIRY,
+    API_MAX_RETRIES,
+    PROMPT_CONTENT_CHARS,
+    DIGEST_CONTENT_TOKENS,
+    CHARS_PER_TOKEN,
+    RESPONSE_CACHE_PATH,
+    RESPONSE_CACHE_TTL,
+)
+from cache import PersistentCache, make_key
 from scraper import Article
 
 
@@ -58,15 +86,6 @@ Example 1:
 Example 2:
 "frames the controversial hymn through a third-culture perspective, arguing that for diaspora Christians, the longing for heavenly home reflects genuine existential displacement rather than escapism, offering spiritual comfort to the globally dispersed."
 
-Example 3:
-"traces Joachim of Fiore's influence on Western thought, showing how medieval eschatology fused vertical spiritual ascent with historical progress, profoundly shaping utopian ideologies and modern definitions of advancement through science and reason."
-
-Example 4:
-"contends that the crisis of young men is not primarily political but formational — a failure of households, churches, and communities to offer the kind of embodied, sacrificial discipleship that forms character rather than merely correcting behavior."
-
-Example 5:
-"looks at evangelical fractures as fundamentally a class conflict between credential-holding elites and working-class congregants, arguing this economic and cultural divide — not theological disagreement — drives much contemporary polarization within American Christianity."
-
 BAD example (includes author name — DON'T DO THIS):
 "Marc Sims examines theological principles guiding church architecture..."
 
@@ -88,62 +107,51 @@ Combined summaries should move from the particular to the universal — naming s
 
 Pull a single concrete image or claim paired with the universal insight it supports. Let the image do the work. Do not explain the connection — trust the reader. Never beg. Never hype. Assume the reader will come because the ideas are worth engaging, not because you've created artificial urgency."""
 
-
-def create_summary_prompt(articles: list[Article], site_name: str = "the publication", output_type: str = "both", digest_articles: list[Article] = None, social_articles: list[Article] = None) -> str:
-    """Create the prompt for generating summaries.
-
-    Args:
-        articles: List of all Article objects
-        site_name: Name of the publication
-        output_type: 'digest', 'social', or 'both'
-        digest_articles: Articles to include in digest (for 'both' mode)
-        social_articles: Articles to generate social posts for (for 'both' mode)
-    """
-    if digest_articles is None:
-        digest_articles = articles
-    if social_articles is None:
-        social_articles = articles
-
-    # Build article text from all unique articles
-    all_articles = list({id(a): a for a in list(digest_articles) + list(social_articles)}.values())
-    articles_text = ""
-    for i, article in enumerate(all_articles, 1):
-        articles_text += f"""
+# The system prompt is identical on every request, so on CLAUDE_MODEL (whose
+# minimum cacheable prefix it clears) mark it for prompt caching: repeat
+# requests within the cache window read it back at a fraction of the
+# input-token cost. It is shorter than FAST_MODEL's minimum, so those
+# requests send it plain (see _system_for).
+SYSTEM_BLOCKS = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
+
+def _system_for(model: str):
+    """System parameter for a request to model, cache-marked only where it can be cached."""
+    return SYSTEM_BLOCKS if model == CLAUDE_MODEL else SYSTEM_PROMPT
+
+
+# Field markers in Claude's responses (see the formats requested in the prompts below)
+_WS_RE = re.compile(r"\s+")
+_HEADLINE_RE = re.compile(r"^[ \t]*HEADLINE:[ \t]*(.*)", re.MULTILINE)
+_COMBINED_SUMMARY_RE = re.compile(
+    r"^[ \t]*COMBINED_SUMMARY:(.*?)(?=^[ \t]*(?:ARTICLE_SUMMARIES:|\d+\.[ \t]*SUMMARY:)|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+# Article summaries are numbered in input order; titles and authors aren't
+# round-tripped through Claude, they're filled back in from our own Articles
+_SUMMARY_START_RE = re.compile(r"[ \t]*(\d+)\.[ \t]*SUMMARY:")
+_ARTICLE_SUMMARY_RE = re.compile(
+    r"^[ \t]*(?P<number>\d+)\.[ \t]*SUMMARY:(?P<summary>.*?)(?=^[ \t]*\d+\.[ \t]*SUMMARY:|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+_POST_HEADLINE_RE = re.compile(r"^[ \t]*POST_HEADLINE:[ \t]*(.*)", re.MULTILINE)
+_POST_SUMMARY_RE = re.compile(r"^[ \t]*POST_SUMMARY:(.*)", re.MULTILINE | re.DOTALL)
+
+
+# Prompt templates, filled in with str.format by the functions below
+ARTICLE_BLOCK_TEMPLATE = """
 ---
-ARTICLE {i}
-Title: {article.title}
-Author: {article.author}
-URL: {article.url}
+ARTICLE {number}
+Title: {title}
+Author: {author}
+URL: {url}
 
 Content:
-{article.content[:5000]}
+{content}
 ---
 """
 
-    # Build the prompt based on output_type
-    if output_type == "social":
-        return f"""Generate social media posts for the following {len(articles)} articles from {site_name}.
-
-{articles_text}
-
-For each article, provide a social media post with:
-- A compelling headline (can be the article title or a catchier version, max 10 words)
-- One sentence of compelling and accurate summary (punchy and shareable)
-- The post should make people want to click and read the full article
-
-Format your response EXACTLY as follows (this format will be parsed programmatically):
-
-SOCIAL_POSTS:
-1. POST_HEADLINE: [Catchy headline for social media]
-POST_SUMMARY: [One compelling sentence]
-
-2. POST_HEADLINE: [Catchy headline for social media]
-POST_SUMMARY: [One compelling sentence]
-
-[Continue for all articles...]"""
-
-    elif output_type == "digest":
-        return f"""Generate a complete digest for the following {len(articles)} articles from {site_name}.
+DIGEST_PROMPT_TEMPLATE = """Generate a complete digest for the following {count} articles from {site_name}.
 
 {articles_text}
 
@@ -162,12 +170,10 @@ Please provide:
 
    GOOD example (specific): "This week's Mere Orthodoxy Digest examines smartphone addiction through Tony Reinke's digital minimalism framework, traces J.C. Ryle's influence on Anglican pastoral care, and considers whether evangelical fractures stem from class conflict rather than theological disagreement."
 
-3. **INDIVIDUAL SUMMARIES**: For each article, provide:
-   - The article title (exactly as given)
-   - The author name (exactly as given)
+3. **INDIVIDUAL SUMMARIES**: For each article, in the order given, provide:
    - A summary that STARTS WITH AN ACTIVE VERB (examines, argues, traces, frames, looks at, contends, etc.)
    - DO NOT include the author's name in the summary - it will be added automatically
-   - Maximum 50 words per summary
+   - Maximum 50 words per summary. STOP at 50 words: end on a complete sentence, with no ellipses
 
 Format your response EXACTLY as follows (this format will be parsed programmatically):
 
@@ -176,99 +182,150 @@ HEADLINE: [Your headline here]
 COMBINED_SUMMARY: [Your 2-3 sentence thematic summary here]
 
 ARTICLE_SUMMARIES:
-1. TITLE: [Article 1 title]
-AUTHOR: [Article 1 author]
-SUMMARY: [active verb] [rest of 50-word max summary - NO author name]
+1. SUMMARY: [active verb] [rest of Article 1's 50-word max summary - NO author name]
 
-2. TITLE: [Article 2 title]
-AUTHOR: [Article 2 author]
-SUMMARY: [active verb] [rest of 50-word max summary - NO author name]
+2. SUMMARY: [active verb] [rest of Article 2's 50-word max summary - NO author name]
 
-[Continue for all articles...]
+[Continue for all articles, numbered as in the input...]
 
 CRITICAL: Each summary must START WITH A VERB like "examines", "argues", "traces", "frames", "contends", "looks at". DO NOT start with the author's name."""
 
-    else:  # both
-        # Build specific article lists for digest and social
-        digest_titles = [a.title for a in digest_articles]
-        social_titles = [a.title for a in social_articles]
+SOCIAL_POST_PROMPT_TEMPLATE = """Generate a social media post for the following article from {site_name}.
 
-        digest_list = ', '.join(f'Article titled "{t}"' for t in digest_titles)
-        social_list = ', '.join(f'Article titled "{t}"' for t in social_titles)
-        digest_instruction = f"Generate DIGEST SUMMARIES for these {len(digest_articles)} articles: {digest_list}"
-        social_instruction = f"Generate SOCIAL MEDIA POSTS for these {len(social_articles)} articles: {social_list}"
+---
+Title: {title}
+Author: {author}
+URL: {url}
 
-        return f"""Generate a complete digest and social posts for articles from {site_name}.
+Content:
+{content}
+---
 
-{articles_text}
+Provide a social media post with:
+- A compelling headline (can be the article title or a catchier version, max 10 words)
+- One sentence of compelling and accurate summary (punchy and shareable)
+- The post should make people want to click and read the full article
 
-Please provide:
+Format your response EXACTLY as follows (this format will be parsed programmatically):
 
-1. **HEADLINE**: Create a compelling, intellectually engaging headline for the digest. Reference themes from the most interesting articles. Format should be elegant and substantive - capturing the intellectual essence of the collection.
+POST_HEADLINE: [Catchy headline for social media]
+POST_SUMMARY: [One compelling sentence]"""
 
-2. **COMBINED SUMMARY**: Write a 2-3 sentence paragraph that SPECIFICALLY describes the actual content of these articles. This paragraph should:
-   - Start with "This week's {site_name} Digest examines..."
-   - Reference SPECIFIC topics, arguments, or subjects from the articles (e.g., specific people, events, concepts, or debates mentioned)
-   - NOT use vague phrases like "themes of spiritual formation" or "cultural engagement" or "the search for community"
-   - Instead, mention CONCRETE specifics like: a particular author's argument, a specific historical figure, a named concept or book, a particular controversy or event
-   - About 40-60 words total
+SHORTEN_PROMPT_TEMPLATE = """Shorten this article summary to at most {max_words} words. Keep its opening verb and its most specific details, end on a complete sentence, and don't use ellipses.
 
-   BAD example (too vague): "This week's Digest examines how Christians navigate technology and community, exploring themes of spiritual formation and cultural engagement."
+{summary}
 
-   GOOD example (specific): "This week's Mere Orthodoxy Digest examines smartphone addiction through Tony Reinke's digital minimalism framework, traces J.C. Ryle's influence on Anglican pastoral care, and considers whether evangelical fractures stem from class conflict rather than theological disagreement."
+Reply with only the shortened summary."""
 
-3. **INDIVIDUAL SUMMARIES**: {digest_instruction}
-   For each of these articles, provide:
-   - The article title (exactly as given)
-   - The author name (exactly as given)
-   - A summary that STARTS WITH AN ACTIVE VERB (examines, argues, traces, frames, looks at, contends, etc.)
-   - DO NOT include the author's name in the summary - it will be added automatically
-   - Maximum 50 words per summary
 
-4. **SOCIAL MEDIA POSTS**: {social_instruction}
-   For each of these articles, provide a social media post with:
-   - A compelling headline (can be the article title or a catchier version, max 10 words)
-   - One sentence of compelling and accurate summary (different from the digest summary - more punchy and shareable)
-   - The post should make people want to click and read the full article
+def create_summary_prompt(articles: list[Article], site_name: str = "the publication") -> str:
+    """Create the prompt for generating the digest (headline, combined and per-article summaries).
 
-Format your response EXACTLY as follows (this format will be parsed programmatically):
+    Args:
+        articles: List of Article objects
+        site_name: Name of the publication
+    """
+    # Share the digest's content budget between its articles: a large digest
+    # gets shorter excerpts instead of an ever-growing prompt
+    max_chars = min(PROMPT_CONTENT_CHARS, DIGEST_CONTENT_TOKENS * CHARS_PER_TOKEN // max(len(articles), 1))
+    articles_text = "".join(
+        ARTICLE_BLOCK_TEMPLATE.format(
+            number=i, title=article.title, author=article.author, url=article.url,
+            content=article.content_for_prompt(max_chars),
+        )
+        for i, article in enumerate(articles, 1)
+    )
 
-HEADLINE: [Your headline here]
+    return DIGEST_PROMPT_TEMPLATE.format(count=len(articles), site_name=site_name, articles_text=articles_text)
 
-COMBINED_SUMMARY: [Your 2-3 sentence thematic summary here]
 
-ARTICLE_SUMMARIES:
-1. TITLE: [Article 1 title]
-AUTHOR: [Article 1 author]
-SUMMARY: [active verb] [rest of 50-word max summary - NO author name]
+def create_social_post_prompt(article: Article, site_name: str = "the publication") -> str:
+    """Create the prompt for one article's social media post.
 
-2. TITLE: [Article 2 title]
-AUTHOR: [Article 2 author]
-SUMMARY: [active verb] [rest of 50-word max summary - NO author name]
+    Posts don't depend on each other, so each article gets its own request
+    and DigestGenerator sends them in parallel.
+    """
+    return SOCIAL_POST_PROMPT_TEMPLATE.format(
+        site_name=site_name, title=article.title, author=article.author, url=article.url,
+        content=article.content_for_prompt(),
+    )
 
-[Continue for all articles...]
 
-SOCIAL_POSTS:
-1. POST_HEADLINE: [Catchy headline for social media]
-POST_SUMMARY: [One compelling sentence]
+def create_shorten_prompt(summary: str) -> str:
+    """Create the prompt asking for an over-long summary to be rewritten within MAX_SUMMARY_WORDS."""
+    return SHORTEN_PROMPT_TEMPLATE.format(max_words=MAX_SUMMARY_WORDS, summary=summary)
 
-2. POST_HEADLINE: [Catchy headline for social media]
-POST_SUMMARY: [One compelling sentence]
 
-[Continue for all articles...]
+def _cap_words(summary: str) -> str:
+    """Enforce MAX_SUMMARY_WORDS on a whitespace-normalized summary (a last resort: it cuts mid-clause)."""
+    # Words are separated by single spaces, so counting them needs no split
+    if summary.count(" ") < MAX_SUMMARY_WORDS:
+        return summary
+    return " ".join(summary.split(" ")[:MAX_SUMMARY_WORDS]) + "..."
 
-CRITICAL: Each summary must START WITH A VERB like "examines", "argues", "traces", "frames", "contends", "looks at". DO NOT start with the author's name."""
+
+def _digest_max_tokens(article_count: int) -> int:
+    """Output budget for a digest of article_count articles."""
+    return min(DIGEST_MAX_TOKENS, DIGEST_BASE_TOKENS + DIGEST_TOKENS_PER_ARTICLE * article_count)
+
+
+# The SDK's HTTP transport (httpx, or httpx2 in newer releases) isn't ours to
+# import; take its Limits class from the SDK's own default limits instead
+_Limits = type(DEFAULT_CONNECTION_LIMITS)
+
+# One client per process: it owns the HTTP connection pool, so sharing it keeps
+# connections to the API warm across requests and DigestGenerator instances
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> Anthropic:
+    """Return the process-wide Anthropic client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # Size the pool to our own concurrency rather than the SDK's defaults
+                http_client = DefaultHttpxClient(limits=_Limits(
+                    max_connections=API_MAX_CONNECTIONS,
+                    max_keepalive_connections=API_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=API_KEEPALIVE_EXPIRY,
+                ))
+                # The SDK retries rate limits and overloads itself, backing off per
+                # retry-after, so a throttled call waits instead of failing the digest
+                _client = Anthropic(api_key=ANTHROPIC_API_KEY, http_client=http_client,
+                                    max_retries=API_MAX_RETRIES)
+    return _client
+
+
+# Claude responses (digests and social posts), reused when the same prompt comes up again
+_response_cache = PersistentCache(RESPONSE_CACHE_PATH, RESPONSE_CACHE_TTL)
+
+
+def _response_key(prompt: str, model: str) -> str:
+    """Cache key for a prompt's response (changes if the model or system prompt does)."""
+    return make_key(model, SYSTEM_PROMPT, prompt)
+
+
+# Token counts reported in a digest's "usage"; the cache fields are absent from
+# responses of older API versions, so they default to 0
+_USAGE_FIELDS = ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
 
 
 class DigestGenerator:
     """Generates article digest using Claude API."""
 
-    def __init__(self):
-        if not ANTHROPIC_API_KEY:
-            raise ValueError("ANTHROPIC_API_KEY not found. Please set it in your .env file.")
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
-
-    def generate_digest(self, articles: list[Article], progress_callback=None, site_name: str = "the publication", output_type: str = "both", digest_count: int = None, social_count: int = None) -> dict:
+    def __init__(self, client: Anthropic | None = None, response_cache: PersistentCache | None = None):
+        if client is None:
+            if not ANTHROPIC_API_KEY:
+                raise ValueError("ANTHROPIC_API_KEY not found. Please set it in your .env file.")
+            client = _get_client()
+        self.client = client
+        self.response_cache = response_cache or _response_cache
+        self.usage = {}
+        self._usage_lock = threading.Lock()
+
+    def generate_digest(self, articles: list[Article], progress_callback=None, site_name: str = "the publication", output_type: str = "both", digest_count: int = None, social_count: int = None, batch: bool = False, force_refresh: bool = False) -> dict:
         """Generate the complete digest for a list of articles.
 
         Args:
@@ -278,7 +335,28 @@ class DigestGenerator:
             output_type: 'digest', 'social', or 'both'
             digest_count: Number of articles to include in digest (for 'both' mode)
             social_count: Number of articles to generate social posts for (for 'both' mode)
+            batch: Submit the requests through the Message Batches API (half the
+                token price, but results can take minutes to hours)
+            force_refresh: Ask Claude again even for prompts with a cached response
+                (the new responses replace the cached ones)
+
+        The result's "usage" maps each model called to its request count and
+        token totals (cached responses cost nothing and aren't counted).
         """
+        self.usage = {}
+
+        # The same article can be scraped twice (e.g. featured and listed);
+        # don't pay to summarize it twice. Pasted articles may have no URL,
+        # so those are told apart by their title and text instead.
+        unique_articles = {}
+        for article in articles:
+            key = article.url or (article.title, article.content)
+            unique_articles.setdefault(key, article)
+        if len(unique_articles) < len(articles):
+            if progress_callback:
+                progress_callback(f"Deduplicated {len(articles)} → {len(unique_articles)} articles")
+            articles = list(unique_articles.values())
+
         if progress_callback:
             progress_callback("Sending articles to Claude for summarization...")
 
@@ -290,122 +368,274 @@ class DigestGenerator:
             digest_articles = articles
             social_articles = articles
 
-        prompt = create_summary_prompt(
-            articles,
-            site_name=site_name,
-            output_type=output_type,
-            digest_articles=digest_articles,
-            social_articles=social_articles
-        )
-
-        message = self.client.messages.create(
-            model=CLAUDE_MODEL,
-            max_tokens=4096,
-            system=SYSTEM_PROMPT,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-
+        digest_prompt = None
+        if output_type != "social":
+            digest_prompt = create_summary_prompt(digest_articles, site_name=site_name)
+        social_prompts = []
+        if output_type != "digest":
+            social_prompts = [create_social_post_prompt(article, site_name=site_name) for article in social_articles]
+
+        # Only prompts we haven't seen before are sent to Claude: an identical
+        # digest prompt means the same articles (and excerpts) as an earlier run,
+        # and a social post depends only on its own article
+        cached_digest = None
+        cached_posts = [None] * len(social_prompts)
+        if not force_refresh:
+            if digest_prompt:
+                cached_digest = self.response_cache.get(_response_key(digest_prompt, CLAUDE_MODEL))
+            cached_posts = [self.response_cache.get(_response_key(prompt, FAST_MODEL)) for prompt in social_prompts]
+        pending_digest = digest_prompt if cached_digest is None else None
+        pending_prompts = [prompt for prompt, text in zip(social_prompts, cached_posts) if text is None]
+        if cached_digest is not None and progress_callback:
+            progress_callback("Reusing the digest already generated for these articles...")
+
+        if batch:
+            new_digest, new_posts = None, []
+            if pending_digest or pending_prompts:
+                new_digest, new_posts = self._run_batch(pending_digest, len(digest_articles), pending_prompts,
+                                                         progress_callback)
+            digest_text = self._merge_digest(digest_prompt, cached_digest, new_digest)
+            social_texts = self._merge_social_posts(social_prompts, cached_posts, new_posts)
+            result = self._build_result(digest_text, digest_articles, social_texts, social_articles, progress_callback)
+        else:
+            # The digest is one request over all articles; each social post is its
+            # own request. They are independent, so they all run concurrently and
+            # the wall-clock cost is roughly that of the slowest one. Social posts
+            # are one templated sentence about one article, so they use FAST_MODEL.
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_API_CALLS) as executor:
+                digest_future = None
+                if pending_digest:
+                    digest_future = executor.submit(
+                        self._stream_digest, pending_digest, len(digest_articles), progress_callback)
+                social_futures = [
+                    executor.submit(self._create_message, prompt, max_tokens=SOCIAL_POST_MAX_TOKENS, model=FAST_MODEL)
+                    for prompt in pending_prompts
+                ]
+                digest_text = self._merge_digest(
+                    digest_prompt, cached_digest, digest_future.result() if digest_future else None)
+                social_texts = self._merge_social_posts(
+                    social_prompts, cached_posts, (future.result() for future in social_futures))
+                result = self._build_result(digest_text, digest_articles, social_texts, social_articles,
+                                            progress_callback)
+
+        result["usage"] = self.usage
         if progress_callback:
-            progress_callback("Parsing Claude's response...")
-
-        response_text = message.content[0].text
-        return self._parse_response(response_text, articles, output_type=output_type)
+            for model, usage in self.usage.items():
+                progress_callback(
+                    f"{model}: {usage['requests']} requests, {usage['input_tokens']} input tokens "
+                    f"({usage['cache_read_input_tokens']} cached), {usage['output_tokens']} output tokens")
+        return result
 
-    def _parse_response(self, response: str, articles: list[Article], output_type: str = "both") -> dict:
-        """Parse Claude's response into structured data."""
+    def _merge_digest(self, prompt: str | None, cached_digest: str | None, new_digest: str | None) -> str | None:
+        """Return the digest response to use, caching it if it was just generated."""
+        if new_digest is None:
+            return cached_digest
+        self.response_cache.set(_response_key(prompt, CLAUDE_MODEL), new_digest)
+        return new_digest
+
+    def _merge_social_posts(self, prompts: list[str], cached_posts: list, new_posts):
+        """Yield each prompt's response, taking cache misses from new_posts in order and caching them."""
+        new_posts = iter(new_posts)
+        for prompt, text in zip(prompts, cached_posts):
+            if text is None:
+                text = next(new_posts)
+                self.response_cache.set(_response_key(prompt, FAST_MODEL), text)
+            yield text
+
+    def _build_result(self, digest_text, digest_articles: list[Article], social_texts,
+                      social_articles: list[Article], progress_callback=None) -> dict:
+        """Parse the digest response (if any) and each social post response into the result dict."""
         result = {
             "headline": "",
             "combined_summary": "",
             "article_summaries": [],
             "social_posts": []
         }
+        if digest_text is not None:
+            if progress_callback:
+                progress_callback("Parsing Claude's response...")
+            parsed = self._parse_response(digest_text, digest_articles)
+            result["headline"] = parsed["headline"]
+            result["combined_summary"] = parsed["combined_summary"]
+            result["article_summaries"] = parsed["article_summaries"]
+            self._shorten_summaries(result["article_summaries"], progress_callback)
+
+        for i, (article, text) in enumerate(zip(social_articles, social_texts), 1):
+            result["social_posts"].append(self._parse_social_post(text, article))
+            if progress_callback:
+                progress_callback(f"Generated social post {i}/{len(social_articles)}...")
 
-        lines = response.strip().split("\n")
-        current_section = None
-        current_article = {}
-        current_post = {}
+        return result
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+    def _shorten_summaries(self, article_summaries: list[dict], progress_callback=None):
+        """Have FAST_MODEL rewrite summaries that overshot MAX_SUMMARY_WORDS, in place.
 
-            if line.startswith("HEADLINE:"):
-                result["headline"] = line.replace("HEADLINE:", "").strip()
-                current_section = "headline"
-            elif line.startswith("COMBINED_SUMMARY:"):
-                result["combined_summary"] = line.replace("COMBINED_SUMMARY:", "").strip()
-                current_section = "combined_summary"
-            elif line.startswith("ARTICLE_SUMMARIES:"):
-                current_section = "articles"
-            elif line.startswith("SOCIAL_POSTS:"):
-                # Save the last article before switching sections
-                if current_article:
-                    result["article_summaries"].append(current_article)
-                    current_article = {}
-                current_section = "social_posts"
-            elif current_section == "combined_summary":
-                # Continue building combined summary until we hit ARTICLE_SUMMARIES
-                if not line.startswith(("HEADLINE:", "ARTICLE_SUMMARIES:", "1.", "TITLE:")):
-                    result["combined_summary"] += " " + line
-            elif current_section == "articles":
-                if line[0].isdigit() and ". TITLE:" in line:
-                    if current_article:
-                        result["article_summaries"].append(current_article)
-                    current_article = {
-                        "title": line.split("TITLE:", 1)[1].strip() if "TITLE:" in line else ""
-                    }
-                elif line.startswith("TITLE:"):
-                    if current_article:
-                        result["article_summaries"].append(current_article)
-                    current_article = {"title": line.replace("TITLE:", "").strip()}
-                elif line.startswith("AUTHOR:"):
-                    current_article["author"] = line.replace("AUTHOR:", "").strip()
-                elif line.startswith("SUMMARY:"):
-                    current_article["summary"] = line.replace("SUMMARY:", "").strip()
-                elif "summary" in current_article and not line.startswith(("TITLE:", "AUTHOR:", "SUMMARY:", "SOCIAL_POSTS:")):
-                    # Continuation of summary
-                    current_article["summary"] += " " + line
-            elif current_section == "social_posts":
-                if line[0].isdigit() and ". POST_HEADLINE:" in line:
-                    if current_post:
-                        result["social_posts"].append(current_post)
-                    current_post = {
-                        "headline": line.split("POST_HEADLINE:", 1)[1].strip() if "POST_HEADLINE:" in line else ""
-                    }
-                elif line.startswith("POST_HEADLINE:"):
-                    if current_post:
-                        result["social_posts"].append(current_post)
-                    current_post = {"headline": line.replace("POST_HEADLINE:", "").strip()}
-                elif line.startswith("POST_SUMMARY:"):
-                    current_post["summary"] = line.replace("POST_SUMMARY:", "").strip()
-                elif "summary" in current_post and not line.startswith(("POST_HEADLINE:", "POST_SUMMARY:")) and not (line[0].isdigit() and "." in line):
-                    # Continuation of post summary
-                    current_post["summary"] += " " + line
-
-        # Add the last article and post
-        if current_article:
-            result["article_summaries"].append(current_article)
-        if current_post:
-            result["social_posts"].append(current_post)
-
-        # Add URLs from original articles
-        for i, summary in enumerate(result["article_summaries"]):
-            if i < len(articles):
-                summary["url"] = articles[i].url
-
-        # Add URLs to social posts
-        for i, post in enumerate(result["social_posts"]):
-            if i < len(articles):
-                post["url"] = articles[i].url
-
-        # Clean up combined summary
-        result["combined_summary"] = " ".join(result["combined_summary"].split())
+        Claude occasionally runs a few words long; only summaries past the
+        tolerance are sent back, as concurrent (and cached) calls, so the digest
+        shows a rewritten sentence rather than one cut off with an ellipsis.
+        """
+        long_summaries = [
+            item for item in article_summaries
+            if item["summary"].count(" ") >= MAX_SUMMARY_WORDS + SUMMARY_WORD_TOLERANCE
+        ]
+        if not long_summaries:
+            return
+        if progress_callback:
+            progress_callback(f"Shortening {len(long_summaries)} over-long summaries...")
+
+        prompts = [create_shorten_prompt(item["summary"]) for item in long_summaries]
+        texts = [self.response_cache.get(_response_key(prompt, FAST_MODEL)) for prompt in prompts]
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_API_CALLS) as executor:
+            futures = {
+                i: executor.submit(self._create_message, prompt, max_tokens=SHORTEN_MAX_TOKENS, model=FAST_MODEL)
+                for i, (prompt, text) in enumerate(zip(prompts, texts)) if text is None
+            }
+            for i, future in futures.items():
+                texts[i] = future.result()
+                self.response_cache.set(_response_key(prompts[i], FAST_MODEL), texts[i])
+
+        for item, text in zip(long_summaries, texts):
+            item["summary"] = _cap_words(_WS_RE.sub(" ", text).strip())
+
+    def _run_batch(self, digest_prompt: str | None, digest_article_count: int, social_prompts: list[str],
+                   progress_callback=None) -> tuple[str | None, list[str]]:
+        """Send the digest and social post prompts as one Message Batch and wait for it.
+
+        Returns the digest response text (None if there was no digest prompt)
+        and the social post response texts, in prompt order.
+        """
+        batch_requests = []
+        if digest_prompt:
+            batch_requests.append(self._batch_request(
+                "digest", digest_prompt, max_tokens=_digest_max_tokens(digest_article_count)))
+        batch_requests.extend(
+            self._batch_request(f"social-{i}", prompt, max_tokens=SOCIAL_POST_MAX_TOKENS, model=FAST_MODEL)
+            for i, prompt in enumerate(social_prompts)
+        )
+
+        message_batch = self.client.messages.batches.create(requests=batch_requests)
+        while message_batch.processing_status != "ended":
+            if progress_callback:
+                counts = message_batch.request_counts
+                progress_callback(f"Waiting for batch {message_batch.id} ({counts.processing} requests processing)...")
+            time.sleep(BATCH_POLL_INTERVAL)
+            message_batch = self.client.messages.batches.retrieve(message_batch.id)
+
+        texts = {}
+        for entry in self.client.messages.batches.results(message_batch.id):
+            if entry.result.type != "succeeded":
+                raise RuntimeError(f"Batch request {entry.custom_id} did not succeed ({entry.result.type})")
+            message = entry.result.message
+            self._record_usage(CLAUDE_MODEL if entry.custom_id == "digest" else FAST_MODEL, message.usage)
+            texts[entry.custom_id] = message.content[0].text
+
+        digest_text = texts["digest"] if digest_prompt else None
+        return digest_text, [texts[f"social-{i}"] for i in range(len(social_prompts))]
+
+    def _batch_request(self, custom_id: str, prompt: str, max_tokens: int, model: str = CLAUDE_MODEL) -> dict:
+        """Build one Message Batches request entry (same parameters as _create_message)."""
+        return {
+            "custom_id": custom_id,
+            "params": {
+                "model": model,
+                "max_tokens": max_tokens,
+                "system": _system_for(model),
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ]
+            }
+        }
+
+    def _create_message(self, prompt: str, max_tokens: int = 4096, model: str = CLAUDE_MODEL) -> str:
+        """Send a single prompt to Claude and return the response text."""
+        message = self.client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            system=_system_for(model),
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+        self._record_usage(model, message.usage)
+        return message.content[0].text
+
+    def _record_usage(self, model: str, usage):
+        """Add one response's token usage to this digest's per-model totals."""
+        with self._usage_lock:
+            totals = self.usage.setdefault(model, dict.fromkeys(("requests", *_USAGE_FIELDS), 0))
+            totals["requests"] += 1
+            for field in _USAGE_FIELDS:
+                totals[field] += getattr(usage, field, None) or 0
+
+    def _stream_digest(self, prompt: str, article_count: int, progress_callback=None) -> str:
+        """Stream the digest response, reporting each article summary as it completes.
+
+        The digest is the longest generation, so rather than waiting silently for
+        the whole response, count SUMMARY: lines as they arrive. The text is
+        still parsed once, at the end.
+        """
+        parts = []
+        pending = ""
+        summaries_done = 0
+        with self.client.messages.stream(
+            model=CLAUDE_MODEL,
+            max_tokens=_digest_max_tokens(article_count),
+            system=SYSTEM_BLOCKS,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        ) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                if not progress_callback:
+                    continue
+                pending += text
+                *lines, pending = pending.split("\n")
+                for line in lines:
+                    if _SUMMARY_START_RE.match(line):
+                        summaries_done += 1
+                        progress_callback(f"Summarized article {summaries_done}/{article_count}...")
+            self._record_usage(CLAUDE_MODEL, stream.get_final_message().usage)
+        return "".join(parts)
+
+    def _parse_response(self, response: str, articles: list[Article]) -> dict:
+        """Parse Claude's digest response into structured data."""
+        headline = _HEADLINE_RE.search(response)
+        combined = _COMBINED_SUMMARY_RE.search(response)
+        result = {
+            "headline": headline.group(1).strip() if headline else "",
+            "combined_summary": _WS_RE.sub(" ", combined.group(1)).strip() if combined else "",
+            "article_summaries": []
+        }
+
+        seen = set()
+        for match in _ARTICLE_SUMMARY_RE.finditer(response):
+            index = int(match.group("number")) - 1
+            if not 0 <= index < len(articles) or index in seen:
+                continue
+            seen.add(index)
+            article = articles[index]
+            result["article_summaries"].append({
+                "title": article.title,
+                "author": article.author,
+                "summary": _WS_RE.sub(" ", match.group("summary")).strip(),
+                "url": article.url
+            })
 
         return result
 
+    def _parse_social_post(self, response: str, article: Article) -> dict:
+        """Parse one article's social post response."""
+        post = {}
+        headline = _POST_HEADLINE_RE.search(response)
+        if headline:
+            post["headline"] = headline.group(1).strip()
+        summary = _POST_SUMMARY_RE.search(response)
+        if summary:
+            post["summary"] = _WS_RE.sub(" ", summary.group(1)).strip()
+        post["url"] = article.url
+        return post
+
     def format_digest(self, digest: dict) -> str:
         """Format the digest for display/output."""
         output = []
@@ -428,11 +658,6 @@ class DigestGenerator:
             author = article.get("author", "Unknown Author")
             summary = article.get("summary", "")
 
-            # Enforce word limit
-            words = summary.split()
-            if len(words) > MAX_SUMMARY_WORDS:
-                summary = " ".join(words[:MAX_SUMMARY_WORDS]) + "..."
-
             output.append(f"{i}. **{title}**")
             output.append(f"")
             output.append(f"*{author}* {summary}")